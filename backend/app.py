@@ -1,14 +1,54 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Request, Response, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import xlwings as xw
 import os
+import base64
+import gzip
+import hashlib
+import hmac
+import math
+import mmap
+import queue
+import secrets
+import struct
+import time
 import tempfile
+import threading
 import json
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from datetime import datetime
 from functools import wraps
+from io import BytesIO
 
-app = Flask(__name__)
-CORS(app)
+# orjson / brotli는 선택 의존성 (없으면 표준 라이브러리로 대체)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+# 워커 간 파일 잠금 (POSIX는 fcntl, Windows는 msvcrt)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
 
 # 파일 경로
 ACCESS_LOG_FILE = 'access_logs.json'
@@ -22,6 +62,455 @@ PUBLIC_ASSETS_PATH = os.path.join(PROJECT_ROOT, 'public', 'assets')
 ENABLE_IP_WHITELIST = os.getenv('ENABLE_IP_WHITELIST', 'false').lower() == 'true'
 ALLOWED_IPS = ['127.0.0.1', 'localhost']
 
+# 응답 압축 설정
+ENABLE_COMPRESSION = os.getenv('ENABLE_COMPRESSION', 'true').lower() == 'true'
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', '6'))
+COMPRESS_MIMETYPES = ('application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript')
+
+# 요청 제한 설정 (IP/경로별 토큰 버킷 + 무거운 작업 동시 실행 제한)
+ENABLE_RATE_LIMIT = os.getenv('ENABLE_RATE_LIMIT', 'true').lower() == 'true'
+RATE_LIMIT_IDLE_TTL = int(os.getenv('RATE_LIMIT_IDLE_TTL', '600'))
+RATE_LIMIT_MAX_BUCKETS = int(os.getenv('RATE_LIMIT_MAX_BUCKETS', '10000'))
+EXPENSIVE_MAX_CONCURRENCY = int(os.getenv('EXPENSIVE_MAX_CONCURRENCY', '2'))
+EXPENSIVE_RETRY_AFTER = 5
+
+# 세션 토큰 설정
+# false: 개발/테스트 모드 (토큰 없이 관리자 API 호출 가능)
+# true: 관리자 API 호출 시 /api/users/check에서 받은 토큰 필요
+ENABLE_SESSION_AUTH = os.getenv('ENABLE_SESSION_AUTH', 'false').lower() == 'true'
+SESSION_TOKEN_TTL = int(os.getenv('SESSION_TOKEN_TTL', '1800'))
+SESSION_SECRET = os.getenv('SESSION_SECRET', '').encode('utf-8')
+if not SESSION_SECRET:
+    # 워커마다 다른 키가 생성되므로 gunicorn 다중 워커에서는 반드시 SESSION_SECRET 설정
+    SESSION_SECRET = secrets.token_bytes(32)
+    print("⚠️ SESSION_SECRET 미설정 - 임시 키 사용 (재시작 시 토큰 무효화)")
+
+# 실시간 이벤트(SSE) 설정
+SSE_MAX_CLIENTS = int(os.getenv('SSE_MAX_CLIENTS', '24'))
+SSE_QUEUE_SIZE = int(os.getenv('SSE_QUEUE_SIZE', '64'))
+SSE_HEARTBEAT = int(os.getenv('SSE_HEARTBEAT', '15'))
+SSE_HISTORY_SIZE = 200
+# 다른 워커가 발행한 이벤트 확인 주기 (초)
+SSE_POLL_INTERVAL = float(os.getenv('SSE_POLL_INTERVAL', '0.5'))
+
+# 워커 간 캐시 무효화 설정
+# REDIS_URL 미설정: 공유 메모리(mmap) 세대 번호 파일 사용 (같은 서버의 워커끼리)
+# REDIS_URL 설정: Redis pub/sub 사용
+CACHE_BUS_PATH = os.getenv('CACHE_BUS_PATH', os.path.join(BACKEND_DIR, '.cache_bus'))
+REDIS_URL = os.getenv('REDIS_URL', '')
+
+# 업로드 설정 (메모리에서 검증 후 필요한 경우에만 디스크 기록)
+UPLOAD_MAX_EXCEL_SIZE = int(os.getenv('UPLOAD_MAX_EXCEL_SIZE', str(30 * 1024 * 1024)))
+UPLOAD_MAX_IMAGE_SIZE = int(os.getenv('UPLOAD_MAX_IMAGE_SIZE', str(10 * 1024 * 1024)))
+# 폼 필드 등 여유분 포함한 요청 최대 크기
+UPLOAD_MAX_REQUEST_SIZE = max(UPLOAD_MAX_EXCEL_SIZE, UPLOAD_MAX_IMAGE_SIZE) + 1024 * 1024
+# 이 크기까지는 메모리에 보관하고, 넘으면 임시 파일로 전환
+UPLOAD_SPOOL_SIZE = int(os.getenv('UPLOAD_SPOOL_SIZE', str(4 * 1024 * 1024)))
+
+ZIP_MAGIC = b'PK\x03\x04'
+IMAGE_MAGIC = {
+    '.png': (b'\x89PNG\r\n\x1a\n',),
+    '.jpg': (b'\xff\xd8\xff',),
+    '.jpeg': (b'\xff\xd8\xff',)
+}
+
+
+# ========================================
+# JSON 직렬화 / 응답 압축
+# ========================================
+
+def dumps_json(data, pretty=False, default=None, sort_keys=False):
+    """JSON 직렬화 (orjson 우선, 없으면 표준 json) - UTF-8 bytes 반환
+    
+    default: 기본 지원하지 않는 타입의 변환 함수 (json.dumps의 default와 동일)
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if default is not None:
+            # datetime/dataclass도 default로 넘겨 표준 json 경로와 같은 결과가 나오도록 함
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값은 표준 json으로 재시도
+            pass
+    
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2, default=default, sort_keys=sort_keys).encode('utf-8')
+    return json.dumps(
+        data, ensure_ascii=False, separators=(',', ':'), default=default, sort_keys=sort_keys
+    ).encode('utf-8')
+
+
+def loads_json(raw):
+    """JSON 역직렬화 (str/bytes 모두 허용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """jsonify가 dumps_json을 사용하도록 하는 JSON provider
+    
+    sort_keys/compact는 Flask 기본값을 따르고, 한글은 이스케이프하지 않음(ensure_ascii=False).
+    인자를 직접 넘기거나 ensure_ascii=True로 바꾸면 Flask 기본 구현을 사용합니다.
+    """
+    
+    ensure_ascii = False
+    
+    def _fast_dumps(self, obj, pretty=False):
+        return dumps_json(obj, pretty=pretty, default=self.default, sort_keys=self.sort_keys)
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs or self.ensure_ascii:
+            return super().dumps(obj, **kwargs)
+        return self._fast_dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads_json(s)
+    
+    def response(self, *args, **kwargs):
+        if self.ensure_ascii:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self._fast_dumps(obj, pretty=pretty), mimetype=self.mimetype)
+
+
+def choose_encoding(accept_encoding):
+    """Accept-Encoding 헤더에서 사용할 압축 방식 선택 (br > gzip)"""
+    accepted = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    
+    def allowed(encoding):
+        return accepted.get(encoding, accepted.get('*', 0.0)) > 0
+    
+    if brotli is not None and allowed('br'):
+        return 'br'
+    if allowed('gzip'):
+        return 'gzip'
+    return None
+
+
+def compress_body(data, encoding):
+    """응답 본문 압축"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=min(COMPRESS_LEVEL, 11))
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL)
+
+
+class InMemoryUploadRequest(Request):
+    """업로드 파일을 UPLOAD_SPOOL_SIZE까지는 메모리 버퍼에 받는 Request"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+
+
+app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
+app.config['MAX_CONTENT_LENGTH'] = UPLOAD_MAX_REQUEST_SIZE
+app.json = FastJSONProvider(app)
+CORS(app, expose_headers=['X-Session-Token'])
+
+
+@app.after_request
+def compress_response(response):
+    """크기 기준 이상의 텍스트/JSON 응답을 gzip/brotli로 압축"""
+    if not ENABLE_COMPRESSION:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    
+    if (response.direct_passthrough
+            or response.is_streamed
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+    
+    encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+    if encoding is None:
+        return response
+    
+    response.set_data(compress_body(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+@app.errorhandler(413)
+def request_too_large(e):
+    """요청 크기 초과 (MAX_CONTENT_LENGTH)"""
+    return jsonify({'error': f'업로드 파일은 {UPLOAD_MAX_REQUEST_SIZE // (1024 * 1024)}MB 이하만 가능합니다.'}), 413
+
+
+@app.teardown_request
+def release_upload_views(exc):
+    """read_upload가 만든 버퍼 뷰 해제 (업로드 파일이 닫히기 전에 호출됨)"""
+    for view in g.pop('upload_views', ()):
+        view.release()
+
+
+# ========================================
+# 데이터 캐시 / 워커 간 무효화
+# ========================================
+
+def lock_file(f, blocking=True):
+    """파일 배타 잠금 - 워커(프로세스) 간 잠금, blocking=False면 바로 실패 시 False 반환"""
+    if fcntl is not None:
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(f.fileno(), flags)
+        except BlockingIOError:
+            return False
+        return True
+    
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.01)
+
+
+def unlock_file(f):
+    """lock_file로 건 잠금 해제"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class MmapInvalidationBus:
+    """공유 메모리 세대 번호 - 저장한 워커가 번호를 올리면 다른 워커의 캐시가 무효화됨
+    
+    'events' 번호는 SSE 이벤트의 전역 id이며, 최근 이벤트는 .cache_bus.events 파일에 보관합니다.
+    """
+    
+    SLOTS = ('users', 'policies', 'logs', 'events')
+    
+    def __init__(self, path):
+        size = 8 * len(self.SLOTS)
+        self.path = path
+        self._file = open(path, 'a+b')
+        if os.fstat(self._file.fileno()).st_size < size:
+            self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+    
+    @contextmanager
+    def lock(self, name):
+        """워커 간 배타 잠금 (저장소마다 .cache_bus.<name>.lock 파일 사용)"""
+        with open(f'{self.path}.{name}.lock', 'a+b') as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
+    
+    def generation(self, name):
+        return struct.unpack_from('<Q', self._mmap, self.SLOTS.index(name) * 8)[0]
+    
+    def publish(self, name):
+        """세대 번호를 1 올리고 반환 (반드시 lock(name) 안에서 호출)"""
+        offset = self.SLOTS.index(name) * 8
+        generation = struct.unpack_from('<Q', self._mmap, offset)[0] + 1
+        struct.pack_into('<Q', self._mmap, offset, generation)
+        return generation
+    
+    def append_event(self, record, keep):
+        """이벤트 로그에 추가하고 전역 id 반환 (최근 keep개만 보관)"""
+        with self.lock('events'):
+            record['id'] = self.generation('events') + 1
+            events = self.read_events()[1 - keep:] if keep > 1 else []
+            events.append(record)
+            
+            events_path = f'{self.path}.events'
+            tmp_path = f'{events_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps_json(events))
+            os.replace(tmp_path, events_path)
+            return self.publish('events')
+    
+    def read_events(self):
+        """보관 중인 최근 이벤트 (오래된 순)"""
+        try:
+            with open(f'{self.path}.events', 'rb') as f:
+                return loads_json(f.read())
+        except FileNotFoundError:
+            return []
+
+
+class RedisInvalidationBus:
+    """Redis 세대 번호(INCR) + pub/sub 알림 - MmapInvalidationBus와 같은 인터페이스"""
+    
+    CHANNEL = 'retention:invalidate'
+    EVENTS_KEY = 'retention:events'
+    LOCK_TIMEOUT = 60
+    
+    def __init__(self, url):
+        self._client = redis.Redis.from_url(url)
+        self._generations = {}
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.CHANNEL: self._on_message})
+        self._thread = self._pubsub.run_in_thread(sleep_time=1, daemon=True)
+    
+    def _on_message(self, message):
+        name, _, generation = message['data'].decode('utf-8').partition(':')
+        self._remember(name, int(generation))
+    
+    def _remember(self, name, generation):
+        # 알림 순서가 뒤바뀌어도 세대 번호가 뒤로 가지 않도록 큰 값만 반영
+        self._generations[name] = max(self._generations.get(name, 0), generation)
+    
+    def lock(self, name):
+        """워커 간 배타 잠금 (Redis 분산 잠금)"""
+        return self._client.lock(f'retention:lock:{name}', timeout=self.LOCK_TIMEOUT)
+    
+    def generation(self, name):
+        return self._generations.get(name, 0)
+    
+    def publish(self, name):
+        """세대 번호를 1 올리고 반환 (반드시 lock(name) 안에서 호출)"""
+        generation = self._client.incr(f'retention:generation:{name}')
+        self._remember(name, generation)
+        self._client.publish(self.CHANNEL, f'{name}:{generation}')
+        return generation
+    
+    def append_event(self, record, keep):
+        """이벤트 목록에 추가하고 전역 id 반환 (최근 keep개만 보관)"""
+        with self.lock('events'):
+            record['id'] = int(self._client.get('retention:generation:events') or 0) + 1
+            pipe = self._client.pipeline()
+            pipe.rpush(self.EVENTS_KEY, dumps_json(record))
+            pipe.ltrim(self.EVENTS_KEY, -keep, -1)
+            pipe.execute()
+            return self.publish('events')
+    
+    def read_events(self):
+        """보관 중인 최근 이벤트 (오래된 순)"""
+        return [loads_json(raw) for raw in self._client.lrange(self.EVENTS_KEY, 0, -1)]
+
+
+def create_invalidation_bus():
+    """REDIS_URL이 있으면 Redis, 없으면 공유 메모리 사용"""
+    if REDIS_URL:
+        if redis is None:
+            raise RuntimeError('REDIS_URL 사용 시 redis 패키지가 필요합니다.')
+        return RedisInvalidationBus(REDIS_URL)
+    return MmapInvalidationBus(CACHE_BUS_PATH)
+
+
+class CachedJSONStore:
+    """JSON 파일 캐시 - 세대 번호가 바뀔 때만 파일을 다시 읽음"""
+    
+    def __init__(self, name, path, bus, default=None):
+        self.name = name
+        self.path = path
+        self.bus = bus
+        self.default = default
+        self._raw = None
+        self._generation = None
+        self._lock = threading.Lock()
+        # 읽기-수정-저장 잠금 (스레드 간은 RLock, 워커 간은 bus.lock - locked() 참고)
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+    
+    @contextmanager
+    def locked(self):
+        """읽기-수정-저장 구간 직렬화 - 같은 워커의 스레드와 다른 워커 모두 대기 (중첩 가능)"""
+        with self._write_lock:
+            self._write_depth += 1
+            try:
+                if self._write_depth == 1:
+                    with self.bus.lock(self.name):
+                        yield
+                else:
+                    yield
+            finally:
+                self._write_depth -= 1
+    
+    def sync(self):
+        """다른 워커가 저장했으면 다시 읽고, 최신 원본(bytes) 반환"""
+        generation = self.bus.generation(self.name)
+        with self._lock:
+            if self._raw is not None and self._generation == generation:
+                return self._raw
+            
+            if self.default is not None and not os.path.exists(self.path):
+                self._raw = dumps_json(self.default())
+            else:
+                with open(self.path, 'rb') as f:
+                    self._raw = f.read()
+            self._generation = generation
+            return self._raw
+    
+    def load(self):
+        """데이터 로드 (호출마다 새 객체 반환 - 수정해도 캐시에 영향 없음)"""
+        return loads_json(self.sync())
+    
+    def save(self, data):
+        """워커 간 잠금 안에서 파일 교체 → 세대 번호 증가"""
+        raw = dumps_json(data, pretty=True)
+        with self.locked():
+            # 다른 워커가 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, self.path)
+            generation = self.bus.publish(self.name)
+            
+            with self._lock:
+                # 받은 번호가 최신일 때만 캐시로 사용 (아니면 다음 sync에서 파일을 다시 읽음)
+                if self.bus.generation(self.name) == generation:
+                    self._raw = raw
+                    self._generation = generation
+                else:
+                    self._raw = None
+
+
+cache_bus = create_invalidation_bus()
+users_store = CachedJSONStore('users', USERS_FILE, cache_bus)
+policies_store = CachedJSONStore('policies', POLICIES_JSON_PATH, cache_bus)
+logs_store = CachedJSONStore('logs', ACCESS_LOG_FILE, cache_bus, default=list)
+
+
+def with_store_lock(store):
+    """저장소를 읽고 수정해서 저장하는 API를 전체 워커에서 한 번에 하나씩 실행"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            with store.locked():
+                return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
 
 def init_users_file():
     """사용자 파일 초기화"""
@@ -40,37 +529,33 @@ def init_users_file():
                 }
             ]
         }
-        with open(USERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(initial_data, f, ensure_ascii=False, indent=2)
+        with users_store.locked():
+            # 다른 워커가 먼저 만들었으면 덮어쓰지 않음
+            if not os.path.exists(USERS_FILE):
+                users_store.save(initial_data)
 
 
 def load_users():
     """사용자 데이터 로드"""
     init_users_file()
-    with open(USERS_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return users_store.load()
 
 
 def save_users(data):
     """사용자 데이터 저장"""
-    with open(USERS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    users_store.save(data)
 
 
 def log_access(log_data):
     """접속 로그 기록"""
     try:
-        if os.path.exists(ACCESS_LOG_FILE):
-            with open(ACCESS_LOG_FILE, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-        else:
-            logs = []
-        
-        logs.append(log_data)
-        logs = logs[-1000:]
-        
-        with open(ACCESS_LOG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, ensure_ascii=False, indent=2)
+        with logs_store.locked():
+            logs = logs_store.load()
+            
+            logs.append(log_data)
+            logs = logs[-1000:]
+            
+            logs_store.save(logs)
     except Exception as e:
         print(f"Log write error: {e}")
 
@@ -98,11 +583,427 @@ def check_ip_whitelist(f):
     return decorated_function
 
 
+class TokenBucketLimiter:
+    """IP/경로별 토큰 버킷 (메모리 전용, 오래 쓰지 않은 버킷은 자동 제거)"""
+    
+    def __init__(self, max_buckets, idle_ttl):
+        self.max_buckets = max_buckets
+        self.idle_ttl = idle_ttl
+        # key -> [남은 토큰, 마지막 갱신 시각], 최근 사용 순서 유지
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def acquire(self, key, rate, capacity):
+        """토큰 1개 사용 - 허용되면 0, 아니면 재시도까지 남은 초 반환"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [float(capacity), now]
+                self._buckets[key] = bucket
+            else:
+                self._buckets.move_to_end(key)
+            
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            
+            if tokens >= 1:
+                bucket[0] = tokens - 1
+                retry_after = 0
+            else:
+                bucket[0] = tokens
+                retry_after = (1 - tokens) / rate
+            
+            self._evict(now)
+            return retry_after
+    
+    def _evict(self, now):
+        """가장 오래 사용하지 않은 버킷부터 제거 (유휴 시간 초과 또는 최대 개수 초과)"""
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_buckets and now - bucket[1] < self.idle_ttl:
+                break
+            self._buckets.popitem(last=False)
+
+
+class ConcurrencySlots:
+    """동시 실행 수 제한 - 슬롯 파일 잠금을 사용하므로 같은 서버의 모든 워커 합산"""
+    
+    def __init__(self, path, count):
+        self.paths = [f'{path}.slot{i}' for i in range(count)]
+    
+    def acquire(self):
+        """빈 슬롯을 잡아 잠긴 파일 반환 - 모두 사용 중이면 None"""
+        for path in self.paths:
+            f = open(path, 'a+b')
+            if lock_file(f, blocking=False):
+                return f
+            f.close()
+        return None
+    
+    def release(self, slot):
+        unlock_file(slot)
+        slot.close()
+
+
+rate_limiter = TokenBucketLimiter(RATE_LIMIT_MAX_BUCKETS, RATE_LIMIT_IDLE_TTL)
+expensive_slots = ConcurrencySlots(CACHE_BUS_PATH, EXPENSIVE_MAX_CONCURRENCY)
+
+
+def too_many_requests(retry_after):
+    """429 응답 (Retry-After 포함)"""
+    response = jsonify({'error': '요청이 너무 많습니다. 잠시 후 다시 시도해주세요.'})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def rate_limit(limit, per=60, burst=None, expensive=False):
+    """요청 제한 - IP/경로별 per초당 limit회, expensive=True면 동시 실행 수도 제한"""
+    rate = limit / per
+    capacity = burst or limit
+    
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not ENABLE_RATE_LIMIT:
+                return f(*args, **kwargs)
+            
+            key = (request.remote_addr, request.endpoint)
+            
+            if not expensive:
+                retry_after = rate_limiter.acquire(key, rate, capacity)
+                if retry_after:
+                    return too_many_requests(retry_after)
+                return f(*args, **kwargs)
+            
+            # 동시 실행 슬롯을 먼저 확인 - 슬롯 부족으로 거절된 요청은 토큰을 쓰지 않음
+            slot = expensive_slots.acquire()
+            if slot is None:
+                return too_many_requests(EXPENSIVE_RETRY_AFTER)
+            try:
+                retry_after = rate_limiter.acquire(key, rate, capacity)
+                if retry_after:
+                    return too_many_requests(retry_after)
+                return f(*args, **kwargs)
+            finally:
+                expensive_slots.release(slot)
+        return decorated_function
+    return decorator
+
+
+# ========================================
+# 세션 토큰
+# ========================================
+
+# users.json 원본 -> {user_id: 토큰 무효화 시각} (users.json이 바뀔 때만 다시 계산)
+_token_revocations = {'raw': None, 'users': {}}
+
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def _sign(payload_b64):
+    return hmac.new(SESSION_SECRET, payload_b64.encode('ascii'), hashlib.sha256).digest()
+
+
+def issue_session_token(user):
+    """사용자 id/역할/상태를 담은 서명 토큰 발급"""
+    now = time.time()
+    payload = {
+        'uid': user['id'],
+        'role': user['role'],
+        'status': user['status'],
+        'iat': now,
+        'exp': now + SESSION_TOKEN_TTL
+    }
+    payload_b64 = _b64encode(dumps_json(payload))
+    return f'{payload_b64}.{_b64encode(_sign(payload_b64))}'
+
+
+def verify_session_token(token):
+    """토큰 검증 - 유효하면 payload, 아니면 None (파일 조회 없음)"""
+    try:
+        payload_b64, signature = token.split('.')
+        if not hmac.compare_digest(_sign(payload_b64), _b64decode(signature)):
+            return None
+        payload = loads_json(_b64decode(payload_b64))
+        if payload['exp'] < time.time():
+            return None
+        # 삭제/거부된 사용자는 목록에 없으므로 거부
+        revoked_at = token_revocations().get(payload['uid'])
+        if revoked_at is None or payload['iat'] <= revoked_at:
+            return None
+    except (ValueError, TypeError, KeyError, OSError):
+        return None
+    
+    return payload
+
+
+def token_revocations():
+    """user_id -> 토큰 무효화 시각 - 모든 워커가 같은 users.json 기준으로 판단"""
+    # 캐시된 users.json이 그대로면 세대 번호만 확인하고 파일을 읽지 않음
+    raw = users_store.sync()
+    if _token_revocations['raw'] is not raw:
+        users = loads_json(raw)['users']
+        _token_revocations['users'] = {u['id']: u.get('tokens_revoked_at', 0) for u in users}
+        _token_revocations['raw'] = raw
+    return _token_revocations['users']
+
+
+def revoke_user_tokens(user):
+    """사용자의 기존 토큰 무효화 (승인/역할 변경 시) - 저장 전에 호출"""
+    user['tokens_revoked_at'] = time.time()
+
+
+def require_session(role=None, allow_query=False):
+    """세션 토큰 확인 - Authorization: Bearer <token>
+    
+    allow_query=True면 ?token= 도 허용 (헤더를 보낼 수 없는 EventSource 전용 -
+    URL의 토큰은 접속 로그/Referer에 남으므로 다른 API에는 사용하지 않음)
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not ENABLE_SESSION_AUTH:
+                return f(*args, **kwargs)
+            
+            auth_header = request.headers.get('Authorization', '')
+            token = None
+            if auth_header.startswith('Bearer '):
+                token = auth_header[7:]
+            elif allow_query:
+                token = request.args.get('token')
+            session = verify_session_token(token) if token else None
+            
+            if session is None or session['status'] != 'approved':
+                return jsonify({'error': '로그인이 필요합니다.'}), 401
+            
+            if role and session['role'] != role:
+                return jsonify({'error': '권한이 없습니다.'}), 403
+            
+            g.session = session
+            response = app.make_response(f(*args, **kwargs))
+            
+            # 유효시간이 절반 이상 지나면 새 토큰 전달
+            if session['exp'] - time.time() < SESSION_TOKEN_TTL / 2:
+                response.headers['X-Session-Token'] = issue_session_token({
+                    'id': session['uid'],
+                    'role': session['role'],
+                    'status': session['status']
+                })
+            return response
+        return decorated_function
+    return decorator
+
+
+# ========================================
+# 실시간 이벤트 (SSE)
+# ========================================
+
+class EventBroker:
+    """변경 이벤트를 SSE 구독자에게 전달 (구독자별 크기 제한 큐)
+    
+    이벤트는 공유 이벤트 로그(bus.append_event)에 전역 id로 기록되고, 각 워커가 로그를 확인해
+    자기 구독자에게 전달합니다. 이벤트는 (id, 종류, data, 관리자 전용 여부) 튜플입니다.
+    """
+    
+    def __init__(self, bus, max_clients, queue_size, history_size, poll_interval):
+        self.bus = bus
+        self.max_clients = max_clients
+        self.queue_size = queue_size
+        self.history_size = history_size
+        self.poll_interval = poll_interval
+        # 구독 큐 -> 관리자 여부
+        self._subscribers = {}
+        # 재연결 시 Last-Event-ID 이후 이벤트를 다시 보내기 위한 최근 이벤트
+        self._history = deque(maxlen=history_size)
+        self._last_id = 0
+        self._generation = None
+        self._poller = None
+        self._lock = threading.Lock()
+    
+    def _resync_event(self):
+        # 최신 id를 함께 보내 재연결 시 같은 Last-Event-ID로 resync가 반복되지 않도록 함
+        return (self._last_id, 'resync', '{}', False)
+    
+    def _drop(self, subscriber):
+        # 대기 중인 이벤트를 비우고 종료 신호(resync) 전달 - _lock 안에서 호출
+        del self._subscribers[subscriber]
+        with subscriber.mutex:
+            subscriber.queue.clear()
+        subscriber.put_nowait(self._resync_event())
+    
+    def _poll(self):
+        """공유 로그에 새 이벤트가 있으면 이 워커의 구독자에게 전달"""
+        generation = self.bus.generation('events')
+        with self._lock:
+            if generation == self._generation:
+                return
+            
+            new_events = [
+                (record['id'], record['type'], record['data'], record['admin_only'])
+                for record in self.bus.read_events()
+                if record['id'] > self._last_id
+            ]
+            # 확인 주기 사이에 보관 개수보다 많은 이벤트가 쌓여 일부를 놓친 경우
+            missed = (self._generation is not None and new_events
+                      and new_events[0][0] > self._last_id + 1)
+            self._generation = generation
+            
+            for event in new_events:
+                self._history.append(event)
+                self._last_id = event[0]
+                if missed:
+                    continue
+                for subscriber, is_admin in list(self._subscribers.items()):
+                    if event[3] and not is_admin:
+                        continue
+                    try:
+                        subscriber.put_nowait(event)
+                    except queue.Full:
+                        # 느린 구독자: 연결을 끊고 재연결 후 전체 다시 조회하도록 안내
+                        self._drop(subscriber)
+            
+            if missed:
+                for subscriber in list(self._subscribers):
+                    self._drop(subscriber)
+    
+    def _run_poller(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self._poll()
+            except (OSError, ValueError) as e:
+                print(f"Event poll error: {e}")
+    
+    def subscribe(self, last_event_id=None, is_admin=False):
+        """구독 큐 생성 - 최대 구독자 수 초과 시 None"""
+        self._poll()
+        subscriber = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_clients:
+                return None
+            
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._run_poller, daemon=True)
+                self._poller.start()
+            
+            if last_event_id is not None:
+                oldest_id = self._history[0][0] if self._history else self._last_id + 1
+                missed = [
+                    event for event in self._history
+                    if event[0] > last_event_id and (is_admin or not event[3])
+                ]
+                # 보관 범위 밖(너무 오래됐거나 현재 id보다 큰 id)이거나 놓친 이벤트가 너무 많으면
+                # 전체 다시 조회하도록 안내
+                if (last_event_id < oldest_id - 1
+                        or last_event_id > self._last_id
+                        or len(missed) >= self.queue_size):
+                    subscriber.put_nowait(self._resync_event())
+                else:
+                    for event in missed:
+                        subscriber.put_nowait(event)
+            
+            self._subscribers[subscriber] = is_admin
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.pop(subscriber, None)
+    
+    def publish(self, event_type, data, admin_only=False):
+        """이벤트를 공유 로그에 기록(전역 id 부여)하고 이 워커의 구독자에게 바로 전달
+        
+        다른 워커의 구독자는 각 워커가 poll_interval마다 로그를 확인해 전달합니다.
+        """
+        record = {
+            'type': event_type,
+            'data': dumps_json(data).decode('utf-8'),
+            'admin_only': admin_only
+        }
+        self.bus.append_event(record, self.history_size)
+        self._poll()
+
+
+event_broker = EventBroker(cache_bus, SSE_MAX_CLIENTS, SSE_QUEUE_SIZE, SSE_HISTORY_SIZE, SSE_POLL_INTERVAL)
+
+
+def publish_event(event_type, admin_only=False, **data):
+    """변경 이벤트 발행 (admin_only=True면 관리자 구독자에게만 전달)"""
+    data['timestamp'] = datetime.now().isoformat()
+    event_broker.publish(event_type, data, admin_only)
+
+
+def publish_policy_updated(policies):
+    """policies.json 변경 이벤트 발행"""
+    metadata = policies.get('metadata', {})
+    publish_event(
+        'policy.updated',
+        version=metadata.get('version'),
+        last_updated=metadata.get('last_updated')
+    )
+
+
+@app.route('/api/events', methods=['GET'])
+@require_session(allow_query=True)
+def stream_events():
+    """변경 이벤트 스트림 (Server-Sent Events)"""
+    last_event_id = request.headers.get('Last-Event-ID', request.args.get('lastEventId'))
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+    
+    # 토큰 검증을 사용하지 않으면 관리자 API와 마찬가지로 모든 이벤트 전달
+    session = g.get('session')
+    is_admin = session is None or session['role'] == 'admin'
+    
+    subscriber = event_broker.subscribe(last_event_id, is_admin)
+    if subscriber is None:
+        response = jsonify({'error': '실시간 연결 수가 너무 많습니다.'})
+        response.status_code = 503
+        response.headers['Retry-After'] = str(SSE_HEARTBEAT)
+        return response
+    
+    def generate():
+        try:
+            yield f'retry: {SSE_HEARTBEAT * 1000}\n\n'
+            while True:
+                try:
+                    event = subscriber.get(timeout=SSE_HEARTBEAT)
+                except queue.Empty:
+                    # 연결 유지 및 끊긴 클라이언트 감지
+                    yield ': ping\n\n'
+                    continue
+                
+                event_id, event_type, data, _ = event
+                yield f'id: {event_id}\nevent: {event_type}\ndata: {data}\n\n'
+                
+                if event_type == 'resync':
+                    return
+        finally:
+            event_broker.unsubscribe(subscriber)
+    
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 # ========================================
 # 사용자 관리 API
 # ========================================
 
 @app.route('/api/users/register', methods=['POST'])
+@rate_limit(5, per=60)
+@with_store_lock(users_store)
 def register_user():
     """사용자 등록 신청"""
     try:
@@ -138,6 +1039,7 @@ def register_user():
         
         users_data['users'].append(new_user)
         save_users(users_data)
+        publish_event('user.registered', admin_only=True, user=new_user)
         
         log_access({
             'action': 'USER_REGISTER',
@@ -170,7 +1072,8 @@ def check_user_status():
                 return jsonify({
                     'exists': True,
                     'status': user['status'],
-                    'user': user
+                    'user': user,
+                    'token': issue_session_token(user)
                 })
         
         return jsonify({'exists': False})
@@ -180,6 +1083,7 @@ def check_user_status():
 
 
 @app.route('/api/users/list', methods=['GET'])
+@require_session(role='admin')
 def get_users():
     """사용자 목록 조회 (관리자용)"""
     try:
@@ -190,6 +1094,8 @@ def get_users():
 
 
 @app.route('/api/users/approve/<user_id>', methods=['POST'])
+@require_session(role='admin')
+@with_store_lock(users_store)
 def approve_user(user_id):
     """사용자 승인 (관리자용)"""
     try:
@@ -199,7 +1105,9 @@ def approve_user(user_id):
             if user['id'] == user_id:
                 user['status'] = 'approved'
                 user['approved_at'] = datetime.now().isoformat()
+                revoke_user_tokens(user)
                 save_users(users_data)
+                publish_event('user.approved', admin_only=True, user=user)
                 
                 log_access({
                     'action': 'USER_APPROVED',
@@ -221,6 +1129,8 @@ def approve_user(user_id):
 
 
 @app.route('/api/users/reject/<user_id>', methods=['POST'])
+@require_session(role='admin')
+@with_store_lock(users_store)
 def reject_user(user_id):
     """사용자 거부 (관리자용)"""
     try:
@@ -228,6 +1138,7 @@ def reject_user(user_id):
         
         users_data['users'] = [u for u in users_data['users'] if u['id'] != user_id]
         save_users(users_data)
+        publish_event('user.rejected', admin_only=True, user_id=user_id)
         
         log_access({
             'action': 'USER_REJECTED',
@@ -245,6 +1156,8 @@ def reject_user(user_id):
 
 
 @app.route('/api/users/delete/<user_id>', methods=['DELETE'])
+@require_session(role='admin')
+@with_store_lock(users_store)
 def delete_user(user_id):
     """사용자 삭제 (관리자용)"""
     try:
@@ -265,6 +1178,7 @@ def delete_user(user_id):
         if deleted:
             users_data['users'] = [u for u in users_data['users'] if u['id'] != user_id]
             save_users(users_data)
+            publish_event('user.deleted', admin_only=True, user_id=user_id)
             
             log_access({
                 'action': 'USER_DELETED',
@@ -285,6 +1199,8 @@ def delete_user(user_id):
 
 
 @app.route('/api/users/change-role/<user_id>', methods=['POST'])
+@require_session(role='admin')
+@with_store_lock(users_store)
 def change_user_role(user_id):
     """사용자 역할 변경 (관리자용)"""
     try:
@@ -310,8 +1226,10 @@ def change_user_role(user_id):
                 # 역할 변경
                 user['role'] = new_role
                 user['role_changed_at'] = datetime.now().isoformat()
+                revoke_user_tokens(user)
                 
                 save_users(users_data)
+                publish_event('user.role_changed', admin_only=True, user=user)
                 
                 log_access({
                     'action': 'USER_ROLE_CHANGED',
@@ -339,8 +1257,29 @@ def change_user_role(user_id):
 # 이미지 업로드 API
 # ========================================
 
+def read_upload(file, max_size):
+    """업로드 파일 내용의 memoryview (메모리 버퍼면 복사 없음) - 크기 초과 시 None"""
+    stream = file.stream
+    # SpooledTemporaryFile이 아직 메모리에 있으면 내부 BytesIO를 그대로 사용
+    buffer = getattr(stream, '_file', stream)
+    if isinstance(buffer, BytesIO):
+        data = buffer.getbuffer()
+        # 뷰가 남아 있으면 버퍼를 닫을 수 없으므로 요청 종료 시 해제
+        g.setdefault('upload_views', []).append(data)
+    else:
+        stream.seek(0)
+        data = memoryview(stream.read(max_size + 1))
+    
+    if len(data) > max_size:
+        return None
+    return data
+
+
 @app.route('/api/upload-image', methods=['POST'])
 @check_ip_whitelist
+@require_session(role='admin')
+@rate_limit(20, per=60, burst=5, expensive=True)
+@with_store_lock(policies_store)
 def upload_image():
     """정책 이미지 업로드 - public/assets에 저장 후 policies.json 업데이트"""
     if 'file' not in request.files:
@@ -357,6 +1296,15 @@ def upload_image():
     if not file.filename.lower().endswith(allowed_ext):
         return jsonify({'error': 'PNG, JPG 이미지 파일만 업로드 가능합니다.'}), 400
     
+    # 디스크에 쓰기 전에 크기와 파일 시그니처 확인
+    data = read_upload(file, UPLOAD_MAX_IMAGE_SIZE)
+    if data is None:
+        return jsonify({'error': f'이미지는 {UPLOAD_MAX_IMAGE_SIZE // (1024 * 1024)}MB 이하만 업로드 가능합니다.'}), 413
+    
+    ext = os.path.splitext(file.filename.lower())[1]
+    if not any(data[:len(magic)] == magic for magic in IMAGE_MAGIC[ext]):
+        return jsonify({'error': '올바른 PNG, JPG 이미지 파일이 아닙니다.'}), 400
+    
     try:
         # public/assets 폴더 생성
         os.makedirs(PUBLIC_ASSETS_PATH, exist_ok=True)
@@ -367,12 +1315,12 @@ def upload_image():
             safe_name += '.png'
         
         save_path = os.path.join(PUBLIC_ASSETS_PATH, safe_name)
-        file.save(save_path)
+        with open(save_path, 'wb') as f:
+            f.write(data)
         
         # policies.json 로드 및 업데이트
         if os.path.exists(POLICIES_JSON_PATH):
-            with open(POLICIES_JSON_PATH, 'r', encoding='utf-8') as f:
-                policies = json.load(f)
+            policies = policies_store.load()
         else:
             return jsonify({'error': 'policies.json을 찾을 수 없습니다.'}), 500
         
@@ -401,8 +1349,9 @@ def upload_image():
             policies['metadata']['last_updated'] = datetime.now().strftime('%Y-%m-%d')
         
         # 저장
-        with open(POLICIES_JSON_PATH, 'w', encoding='utf-8') as f:
-            json.dump(policies, f, ensure_ascii=False, indent=2)
+        policies_store.save(policies)
+        publish_event('policy.image_added', image=new_image)
+        publish_policy_updated(policies)
         
         log_access({
             'action': 'IMAGE_UPLOADED',
@@ -428,6 +1377,8 @@ def upload_image():
 
 @app.route('/api/upload-excel', methods=['POST'])
 @check_ip_whitelist
+@require_session(role='admin')
+@rate_limit(10, per=60, burst=3, expensive=True)
 def upload_excel():
     """DRM 엑셀 파일 업로드"""
     client_ip = request.remote_addr
@@ -451,37 +1402,24 @@ def upload_excel():
     if not file.filename.endswith(('.xlsx', '.xls', '.xlsm')):
         return jsonify({'error': '엑셀 파일만 업로드 가능합니다.'}), 400
     
-    app_excel = None
-    wb = None
-    temp_path = None
+    # 메모리에서 크기 확인 (디스크 기록 없음)
+    data = read_upload(file, UPLOAD_MAX_EXCEL_SIZE)
+    if data is None:
+        return jsonify({'error': f'엑셀 파일은 {UPLOAD_MAX_EXCEL_SIZE // (1024 * 1024)}MB 이하만 업로드 가능합니다.'}), 413
+    
+    if not data:
+        return jsonify({'error': '빈 파일입니다.'}), 400
     
     try:
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx', dir=os.getcwd()) as tmp_file:
-            file.save(tmp_file.name)
-            temp_path = tmp_file.name
-        
-        print(f"📂 임시 파일 저장: {temp_path}")
-        
-        # xlwings로 Excel 실행 (visible=True로 DRM 처리 가능하게)
-        app_excel = xw.App(visible=True, add_book=False)
-        
-        # 파일 열기 시도 (DRM 파일은 Excel에서 직접 열어야 함)
-        print(f"📖 Excel 파일 열기 시도...")
-        wb = app_excel.books.open(temp_path, update_links=False, read_only=True)
+        policy_data = None
         
-        print(f"✅ Excel 파일 열기 성공!")
-        
-        # 파일 파싱
-        policy_data = parse_policy_excel(wb)
+        # 일반 xlsx/xlsm(zip)은 Excel 실행 없이 메모리에서 바로 파싱
+        if data[:4] == ZIP_MAGIC and openpyxl is not None:
+            policy_data = parse_excel_in_memory(data)
         
-        # 정리
-        wb.close()
-        app_excel.quit()
-        
-        # 임시 파일 삭제
-        if temp_path and os.path.exists(temp_path):
-            os.unlink(temp_path)
+        # DRM 파일(보안 헤더)이나 xls는 Excel로 직접 열어야 함
+        if policy_data is None:
+            policy_data = parse_excel_with_xlwings(data, os.path.splitext(file.filename)[1])
         
         log_access({
             'ip': client_ip,
@@ -489,6 +1427,7 @@ def upload_excel():
             'filename': file.filename,
             'timestamp': datetime.now().isoformat()
         })
+        publish_event('excel.processed', admin_only=True, filename=file.filename, success=True)
         
         return jsonify({
             'success': True,
@@ -497,36 +1436,113 @@ def upload_excel():
         })
         
     except Exception as e:
-        # 에러 발생 시 정리
+        error_msg = str(e)
+        print(f"❌ 에러 발생: {error_msg}")
+        
+        log_access({
+            'ip': client_ip,
+            'action': 'ERROR',
+            'error': error_msg,
+            'timestamp': datetime.now().isoformat()
+        })
+        publish_event('excel.processed', admin_only=True, filename=file.filename, success=False)
+        
+        return jsonify({'error': f'파일 처리 중 오류 발생: {error_msg}'}), 500
+
+
+class HeadlessSheet:
+    """openpyxl 시트를 xlwings 시트처럼 사용 (sheet.range('A2').value)"""
+    
+    def __init__(self, worksheet):
+        self.name = worksheet.title
+        self._worksheet = worksheet
+    
+    def range(self, address):
+        return self._worksheet[address]
+
+
+class HeadlessSheets:
+    """wb.sheets 호환 - 순회 및 시트 이름으로 조회"""
+    
+    def __init__(self, workbook):
+        self._sheets = [HeadlessSheet(ws) for ws in workbook.worksheets]
+    
+    def __iter__(self):
+        return iter(self._sheets)
+    
+    def __getitem__(self, name):
+        return next(sheet for sheet in self._sheets if sheet.name == name)
+
+
+class HeadlessWorkbook:
+    """메모리의 xlsx/xlsm을 openpyxl로 연 xlwings 호환 Workbook"""
+    
+    def __init__(self, data):
+        self._workbook = openpyxl.load_workbook(BytesIO(data), data_only=True)
+        self.sheets = HeadlessSheets(self._workbook)
+    
+    def close(self):
+        self._workbook.close()
+
+
+def parse_excel_in_memory(data):
+    """Excel 실행 없이 메모리에서 파싱 - 열 수 없는 파일이면 None"""
+    try:
+        wb = HeadlessWorkbook(data)
+    except Exception as e:
+        print(f"⚠️ 메모리에서 열기 실패, Excel로 재시도: {e}")
+        return None
+    
+    try:
+        print("✅ Excel 파일 열기 성공! (메모리)")
+        return parse_policy_excel(wb)
+    finally:
+        wb.close()
+
+
+def parse_excel_with_xlwings(data, suffix):
+    """xlwings(Excel)로 파싱 - DRM 파일용, 임시 파일은 항상 삭제"""
+    app_excel = None
+    wb = None
+    temp_path = None
+    
+    try:
+        # Excel은 파일 경로가 필요하므로 시스템 임시 폴더에 저장
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix or '.xlsx') as tmp_file:
+            temp_path = tmp_file.name
+            tmp_file.write(data)
+        
+        print(f"📂 임시 파일 저장: {temp_path}")
+        
+        # xlwings로 Excel 실행 (visible=True로 DRM 처리 가능하게)
+        app_excel = xw.App(visible=True, add_book=False)
+        
+        # 파일 열기 시도 (DRM 파일은 Excel에서 직접 열어야 함)
+        print(f"📖 Excel 파일 열기 시도...")
+        wb = app_excel.books.open(temp_path, update_links=False, read_only=True)
+        
+        print(f"✅ Excel 파일 열기 성공!")
+        
+        return parse_policy_excel(wb)
+    
+    finally:
         if wb:
             try:
                 wb.close()
-            except:
+            except Exception:
                 pass
         
         if app_excel:
             try:
                 app_excel.quit()
-            except:
+            except Exception:
                 pass
         
         if temp_path and os.path.exists(temp_path):
             try:
                 os.unlink(temp_path)
-            except:
+            except OSError:
                 pass
-        
-        error_msg = str(e)
-        print(f"❌ 에러 발생: {error_msg}")
-        
-        log_access({
-            'ip': client_ip,
-            'action': 'ERROR',
-            'error': error_msg,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        return jsonify({'error': f'파일 처리 중 오류 발생: {error_msg}'}), 500
 
 
 def parse_policy_excel(wb):
@@ -769,14 +1785,12 @@ def health_check():
 
 
 @app.route('/api/access-logs', methods=['GET'])
+@require_session(role='admin')
 def get_access_logs():
     """접속 로그 조회"""
     try:
-        if os.path.exists(ACCESS_LOG_FILE):
-            with open(ACCESS_LOG_FILE, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-            return jsonify({'logs': logs[-100:]})
-        return jsonify({'logs': []})
+        logs = logs_store.load()
+        return jsonify({'logs': logs[-100:]})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
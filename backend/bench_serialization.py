@@ -0,0 +1,85 @@
+"""JSON 직렬화 / 응답 압축 벤치마크
+
+사용법:
+    cd backend
+    python bench_serialization.py [사용자 수]
+
+/api/users/list 응답과 policies.json(policy_data) 기준으로
+기존 방식(jsonify 표준 json, 압축 없음)과 현재 방식(dumps_json + gzip/brotli)의
+직렬화 시간과 전송 바이트 수를 비교합니다.
+"""
+import gzip
+import json
+import os
+import sys
+import timeit
+from datetime import datetime
+
+from app import POLICIES_JSON_PATH, COMPRESS_LEVEL, dumps_json, orjson, brotli
+
+REPEAT = 200
+
+
+def make_users(count):
+    """벤치마크용 사용자 목록 생성"""
+    now = datetime.now().isoformat()
+    return {
+        'users': [
+            {
+                'id': f'user_{i:06d}',
+                'name': f'상담사{i}',
+                'department': f'리텐션{i % 12}팀',
+                'employeeId': f'{i:06d}',
+                'status': 'approved' if i % 5 else 'pending',
+                'role': 'admin' if i % 50 == 0 else 'user',
+                'created_at': now,
+                'approved_at': now
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def legacy_dumps(data):
+    """기존 jsonify 기본 동작 (ensure_ascii, sort_keys, compact)"""
+    return json.dumps(data, ensure_ascii=True, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def current_dumps(data):
+    """현재 jsonify 동작 (dumps_json, sort_keys는 Flask 기본값 유지)"""
+    return dumps_json(data, sort_keys=True)
+
+
+def per_call_ms(func, data):
+    """1회 직렬화 평균 시간 (ms)"""
+    return timeit.timeit(lambda: func(data), number=REPEAT) / REPEAT * 1000
+
+
+def report(label, data):
+    """직렬화 시간 및 전송 크기 출력"""
+    before = legacy_dumps(data)
+    after = current_dumps(data)
+
+    rows = [
+        ('before: json', per_call_ms(legacy_dumps, data), len(before)),
+        (f"after: {'orjson' if orjson else 'json'}", per_call_ms(current_dumps, data), len(after)),
+        (f'after: gzip({COMPRESS_LEVEL})', None, len(gzip.compress(after, compresslevel=COMPRESS_LEVEL))),
+    ]
+    if brotli is not None:
+        rows.append((f'after: br({COMPRESS_LEVEL})', None, len(brotli.compress(after, quality=COMPRESS_LEVEL))))
+
+    print(f"[{label}]")
+    for name, ms, size in rows:
+        elapsed = f'{ms:8.3f} ms' if ms is not None else ' ' * 11
+        print(f"  {name:<16} {elapsed}  {size:>10,} bytes")
+    print()
+
+
+if __name__ == '__main__':
+    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    report(f'/api/users/list ({user_count}명)', make_users(user_count))
+
+    if os.path.exists(POLICIES_JSON_PATH):
+        with open(POLICIES_JSON_PATH, 'r', encoding='utf-8') as f:
+            report('policies.json', json.load(f))
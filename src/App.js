@@ -5,7 +5,7 @@ import AdminLogin from './components/AdminLogin';
 import AdminDashboard from './components/AdminDashboard';
 import SecurityWatermark from './components/SecurityWatermark';
 import SessionTimeout from './components/SessionTimeout';
-import API_URL from './config';
+import API_URL, { SESSION_EXPIRED_EVENT } from './config';
 
 function App() {
   const [activeTab, setActiveTab] = useState('board');
@@ -27,6 +27,12 @@ function App() {
     }
   }, []);
 
+  // 토큰 재발급까지 실패하면 세션 만료 처리
+  useEffect(() => {
+    window.addEventListener(SESSION_EXPIRED_EVENT, handleSessionTimeout);
+    return () => window.removeEventListener(SESSION_EXPIRED_EVENT, handleSessionTimeout);
+  }, []);
+
   const handleLogin = (status) => {
     setIsAdmin(status);
     if (status) {
@@ -55,6 +61,7 @@ function App() {
     setUserInfo(null);
     localStorage.removeItem('isAuthenticated');
     localStorage.removeItem('userInfo');
+    localStorage.removeItem('sessionToken');
     alert('보안을 위해 세션이 만료되었습니다. 다시 로그인해주세요.');
   };
 
@@ -250,6 +257,7 @@ const LoginScreen = ({ onAuth }) => {
     if (userStatus.exists) {
       if (userStatus.status === 'approved') {
         // 승인된 사용자 - 로그인 허용
+        localStorage.setItem('sessionToken', userStatus.token);
         onAuth({ 
           name: userStatus.user.name, 
           department: userStatus.user.department, 
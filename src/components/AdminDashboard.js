@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import * as XLSX from 'xlsx';
 import UserManagement from './UserManagement';
-import API_URL from '../config';
+import API_URL, { authFetch } from '../config';
 
 const AdminDashboard = ({ onLogout, isAdmin = true }) => {
   const [uploadStatus, setUploadStatus] = useState(null);
@@ -30,7 +30,7 @@ const AdminDashboard = ({ onLogout, isAdmin = true }) => {
     });
 
     // Flask 백엔드 API 호출
-    fetch(`${API_URL}/api/upload-excel`, {
+    authFetch(`${API_URL}/api/upload-excel`, {
       method: 'POST',
       body: formData
     })
@@ -77,7 +77,7 @@ const AdminDashboard = ({ onLogout, isAdmin = true }) => {
       message: '이미지 업로드 중...'
     });
 
-    fetch(`${API_URL}/api/upload-image`, {
+    authFetch(`${API_URL}/api/upload-image`, {
       method: 'POST',
       body: formData
     })
@@ -1,23 +1,84 @@
 import React, { useState, useEffect } from 'react';
-import API_URL from '../config';
+import API_URL, { authFetch, eventsUrl, refreshSessionToken } from '../config';
 
 const UserManagement = () => {
   const [users, setUsers] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [error, setError] = useState('');
   const [filter, setFilter] = useState('all'); // 'all', 'pending', 'approved'
 
+  // 목록에 사용자 추가/교체 (같은 변경이 응답과 이벤트로 두 번 와도 결과 동일)
+  const upsertUser = (user) => {
+    setUsers(prev => (
+      prev.some(u => u.id === user.id)
+        ? prev.map(u => (u.id === user.id ? user : u))
+        : [...prev, user]
+    ));
+  };
+
+  const removeUser = (userId) => {
+    setUsers(prev => prev.filter(u => u.id !== userId));
+  };
+
   useEffect(() => {
     fetchUsers();
+
+    // 다른 관리자의 변경 사항은 서버 이벤트 내용으로 목록에 바로 반영
+    let source = null;
+    let retryTimer = null;
+    let lastEventId = null;
+
+    const handlers = {
+      'user.registered': data => upsertUser(data.user),
+      'user.approved': data => upsertUser(data.user),
+      'user.role_changed': data => upsertUser(data.user),
+      'user.rejected': data => removeUser(data.user_id),
+      'user.deleted': data => removeUser(data.user_id),
+      // 놓친 이벤트가 많을 때만 전체 다시 조회
+      'resync': () => fetchUsers()
+    };
+
+    const connect = () => {
+      source = new EventSource(eventsUrl(lastEventId));
+      Object.entries(handlers).forEach(([type, handler]) => {
+        source.addEventListener(type, (event) => {
+          lastEventId = event.lastEventId || lastEventId;
+          handler(JSON.parse(event.data));
+        });
+      });
+      source.onerror = () => {
+        // 토큰 만료(401) 등으로 연결이 닫히면 토큰을 새로 받아 다시 연결
+        if (source.readyState === EventSource.CLOSED) {
+          retryTimer = setTimeout(async () => {
+            await refreshSessionToken();
+            connect();
+          }, 5000);
+        }
+      };
+    };
+
+    connect();
+
+    return () => {
+      clearTimeout(retryTimer);
+      source.close();
+    };
   }, []);
 
   const fetchUsers = async () => {
     try {
-      const response = await fetch(`${API_URL}/api/users/list`);
+      const response = await authFetch(`${API_URL}/api/users/list`);
       const data = await response.json();
-      setUsers(data.users || []);
+      if (response.ok) {
+        setUsers(data.users || []);
+        setError('');
+      } else {
+        setError(data.error || '사용자 목록을 불러오지 못했습니다.');
+      }
       setLoading(false);
     } catch (error) {
       console.error('사용자 목록 조회 실패:', error);
+      setError('사용자 목록을 불러오지 못했습니다.');
       setLoading(false);
     }
   };
@@ -26,14 +87,14 @@ const UserManagement = () => {
     if (!window.confirm('이 사용자를 승인하시겠습니까?')) return;
 
     try {
-      const response = await fetch(`${API_URL}/api/users/approve/${userId}`, {
+      const response = await authFetch(`${API_URL}/api/users/approve/${userId}`, {
         method: 'POST'
       });
       const data = await response.json();
 
       if (data.success) {
         alert('사용자가 승인되었습니다.');
-        fetchUsers();
+        upsertUser(data.user);
       } else {
         alert(data.error || '승인 실패');
       }
@@ -46,14 +107,14 @@ const UserManagement = () => {
     if (!window.confirm('이 신청을 거부하시겠습니까?')) return;
 
     try {
-      const response = await fetch(`${API_URL}/api/users/reject/${userId}`, {
+      const response = await authFetch(`${API_URL}/api/users/reject/${userId}`, {
         method: 'POST'
       });
       const data = await response.json();
 
       if (data.success) {
         alert('신청이 거부되었습니다.');
-        fetchUsers();
+        removeUser(userId);
       } else {
         alert(data.error || '거부 실패');
       }
@@ -66,14 +127,14 @@ const UserManagement = () => {
     if (!window.confirm('정말 이 사용자를 삭제하시겠습니까?\n삭제 후에는 복구할 수 없습니다.')) return;
 
     try {
-      const response = await fetch(`${API_URL}/api/users/delete/${userId}`, {
+      const response = await authFetch(`${API_URL}/api/users/delete/${userId}`, {
         method: 'DELETE'
       });
       const data = await response.json();
 
       if (data.success) {
         alert('사용자가 삭제되었습니다.');
-        fetchUsers();
+        removeUser(userId);
       } else {
         alert(data.error || '삭제 실패');
       }
@@ -89,7 +150,7 @@ const UserManagement = () => {
     if (!window.confirm(`이 사용자를 ${roleText}로 변경하시겠습니까?`)) return;
 
     try {
-      const response = await fetch(`${API_URL}/api/users/change-role/${userId}`, {
+      const response = await authFetch(`${API_URL}/api/users/change-role/${userId}`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ role: newRole })
@@ -98,7 +159,7 @@ const UserManagement = () => {
 
       if (data.success) {
         alert(data.message);
-        fetchUsers();
+        upsertUser(data.user);
       } else {
         alert(data.error || '역할 변경 실패');
       }
@@ -128,6 +189,12 @@ const UserManagement = () => {
         </p>
       </div>
 
+      {error && (
+        <div className="bg-red-50 border border-red-300 text-red-700 px-4 py-3 rounded mb-6">
+          {error}
+        </div>
+      )}
+
       {/* 필터 */}
       <div className="flex gap-2 mb-6">
         <button
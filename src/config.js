@@ -1,4 +1,71 @@
 // API URL 설정
 const API_URL = process.env.REACT_APP_API_URL || 'http://localhost:5000';
 
+// 세션 토큰 (/api/users/check에서 발급)
+export const authHeaders = (headers = {}) => {
+  const token = localStorage.getItem('sessionToken');
+  return token ? { ...headers, Authorization: `Bearer ${token}` } : headers;
+};
+
+// 서버가 갱신 토큰을 보내면 저장
+export const saveSessionToken = (response) => {
+  const token = response.headers.get('X-Session-Token');
+  if (token) {
+    localStorage.setItem('sessionToken', token);
+  }
+  return response;
+};
+
+// 세션 만료 시 발생하는 window 이벤트 (App에서 로그아웃 처리)
+export const SESSION_EXPIRED_EVENT = 'session-expired';
+
+// 토큰 재발급 - 저장된 사번으로 /api/users/check 다시 호출
+export const refreshSessionToken = async () => {
+  const userInfo = JSON.parse(localStorage.getItem('userInfo') || 'null');
+  if (!userInfo) return false;
+
+  try {
+    const response = await fetch(`${API_URL}/api/users/check`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ employeeId: userInfo.employeeId })
+    });
+    const data = await response.json();
+    if (data.exists && data.status === 'approved' && data.token) {
+      localStorage.setItem('sessionToken', data.token);
+      return true;
+    }
+  } catch (error) {
+    console.error('토큰 재발급 실패:', error);
+  }
+  return false;
+};
+
+// 토큰을 붙여 API 호출 - 401이면 토큰 재발급 후 1회 재시도, 그래도 실패하면 세션 만료
+export const authFetch = async (url, options = {}) => {
+  const send = () => fetch(url, { ...options, headers: authHeaders(options.headers) }).then(saveSessionToken);
+
+  let response = await send();
+  if (response.status === 401) {
+    if (await refreshSessionToken()) {
+      response = await send();
+    }
+    if (response.status === 401) {
+      window.dispatchEvent(new Event(SESSION_EXPIRED_EVENT));
+    }
+  }
+  return response;
+};
+
+// 실시간 이벤트(SSE) 주소 - EventSource는 헤더를 보낼 수 없어 토큰과 마지막 이벤트 id를 쿼리로 전달
+// 재연결할 때마다 다시 호출해 최신 토큰을 사용
+export const eventsUrl = (lastEventId = null) => {
+  const params = new URLSearchParams();
+  const token = localStorage.getItem('sessionToken');
+  if (token) params.set('token', token);
+  if (lastEventId) params.set('lastEventId', lastEventId);
+  const query = params.toString();
+  return `${API_URL}/api/events${query ? `?${query}` : ''}`;
+};
+
 export default API_URL;